@@ -1,5 +1,5 @@
 import os
-from flask import Flask, request, redirect, render_template, session
+from flask import Flask, request, redirect, render_template, session, g
 from dotenv import load_dotenv
 import psycopg2
 import PyPDF2
@@ -7,7 +7,7 @@ import re
 from collections import Counter
 import math
 import random
-import signal
+import threading
 
 
 STOPWORDS = {
@@ -30,12 +30,105 @@ if not DATABASE_URL:
     raise Exception("DATABASE_URL not set")
 
 
+DB_SSLMODE = os.getenv("DB_SSLMODE", "require")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "1"))
+DB_APPLICATION_NAME = "policypulse"
+
+# Connections are opened on demand, at most DB_POOL_SIZE per worker, and kept
+# open for the next request once returned. A sync worker only ever needs one;
+# gunicorn_async.conf.py raises the limit for the gevent worker.
+#
+# Under the gevent worker threading primitives are patched to greenlet-aware
+# ones, so waiting on the semaphore yields instead of blocking. That only holds
+# if this module is imported after the patching, i.e. in the worker rather
+# than a preloading master.
+_db_idle = []
+_db_slots = threading.BoundedSemaphore(DB_POOL_SIZE)
+
+
 def get_db_connection():
-    return psycopg2.connect(
-        DATABASE_URL,
-        connect_timeout=5,
-        sslmode="require"
-    )
+    _db_slots.acquire()
+    try:
+        try:
+            conn = _db_idle.pop()
+        except IndexError:
+            conn = psycopg2.connect(
+                DATABASE_URL,
+                connect_timeout=5,
+                sslmode=DB_SSLMODE,
+                application_name=DB_APPLICATION_NAME
+            )
+    except Exception:
+        _db_slots.release()
+        raise
+    g.setdefault("db_connections", []).append(conn)
+    return conn
+
+
+def release_db_connection(conn):
+    held = g.get("db_connections", [])
+    if conn not in held:
+        return
+    held.remove(conn)
+
+    try:
+        # Never hand a connection with an open transaction to the next request
+        if not conn.closed:
+            conn.rollback()
+    except psycopg2.Error:
+        conn.close()
+
+    try:
+        if not conn.closed:
+            _db_idle.append(conn)
+    finally:
+        _db_slots.release()
+
+
+@app.teardown_appcontext
+def release_leftover_db_connections(exc):
+    # Routes that bail out early (error responses) don't always release
+    for conn in list(g.get("db_connections", [])):
+        release_db_connection(conn)
+
+
+GEMINI_TIMEOUT = float(os.getenv("GEMINI_TIMEOUT", "30"))
+
+
+def gemini_client_options():
+    options = {"api_key": os.getenv("GOOGLE_API_KEY")}
+
+    # "rest" goes through requests/sockets, which gevent can make cooperative;
+    # the default grpc transport blocks the whole worker while it waits
+    transport = os.getenv("GEMINI_TRANSPORT")
+    if transport:
+        options["transport"] = transport
+
+    # e.g. http://127.0.0.1:8081 to point at scripts/stub_gemini.py
+    endpoint = os.getenv("GEMINI_API_ENDPOINT")
+    if endpoint:
+        options["client_options"] = {"api_endpoint": endpoint}
+
+    return options
+
+
+_gemini_configured = False
+_gemini_lock = threading.Lock()
+
+
+def get_gemini_model():
+    import google.generativeai as genai
+
+    # configure() replaces the library's global client, so do it once per
+    # process; models built afterwards share its session and keep-alive
+    global _gemini_configured
+    if not _gemini_configured:
+        with _gemini_lock:
+            if not _gemini_configured:
+                genai.configure(**gemini_client_options())
+                _gemini_configured = True
+
+    return genai.GenerativeModel("gemini-2.5-flash")
 
 def extract_text_from_pdf(file):
     reader = PyPDF2.PdfReader(file)
@@ -203,7 +296,7 @@ def test_db():
         cur.execute("SELECT 1;")
         result = cur.fetchone()
         cur.close()
-        conn.close()
+        release_db_connection(conn)
         return f"Database connected successfully! Result: {result}"
     except Exception as e:
         return f"Database connection failed: {e}"
@@ -242,7 +335,7 @@ def init_db():
 
         conn.commit()
         cur.close()
-        conn.close()
+        release_db_connection(conn)
 
         return "Tables created successfully!"
     except Exception as e:
@@ -271,7 +364,7 @@ def register():
             return f"Error: {e}"
 
         cur.close()
-        conn.close()
+        release_db_connection(conn)
 
         return "User registered successfully!"
 
@@ -295,7 +388,7 @@ def login():
         user = cur.fetchone()
 
         cur.close()
-        conn.close()
+        release_db_connection(conn)
 
         if user and check_password_hash(user[1], password):
             session["user_id"] = user[0]
@@ -370,7 +463,7 @@ def dashboard():
     top_keywords = keyword_freq.most_common(5)
 
     cur.close()
-    conn.close()
+    release_db_connection(conn)
 
     return render_template(
         "dashboard.html",
@@ -401,7 +494,7 @@ def add_policy():
 
         conn.commit()
         cur.close()
-        conn.close()
+        release_db_connection(conn)
 
         return redirect("/dashboard")
 
@@ -447,7 +540,7 @@ def upload_policy():
 
             conn.commit()
             cur.close()
-            conn.close()
+            release_db_connection(conn)
 
             similar_html = ""
             if similar_policies:
@@ -511,7 +604,7 @@ def admin_panel():
 
 
     cur.close()
-    conn.close()
+    release_db_connection(conn)
 
     return render_template(
     "admin_dashboard.html",
@@ -553,11 +646,7 @@ def scheme_advisor():
         # TRY GEMINI (WITH TIMEOUT SAFETY)
         # -------------------
         try:
-            import google.generativeai as genai
-            import signal
-
-            genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
-            model = genai.GenerativeModel("gemini-2.5-flash")
+            model = get_gemini_model()
 
             prompt = f"""
             You are an AI Government Scheme Advisor for Indian citizens.
@@ -585,24 +674,17 @@ def scheme_advisor():
             Do not include unnecessary explanations.
             """
 
-            class TimeoutException(Exception):
-                pass
-
-            def timeout_handler(signum, frame):
-                raise TimeoutException
-
-            signal.signal(signal.SIGALRM, timeout_handler)
-            signal.alarm(30)  # 5 second timeout safety
-
-            response = model.generate_content(prompt)
-
-            signal.alarm(0)  # cancel alarm
+            # Per-request timeout instead of SIGALRM: the alarm is process-wide,
+            # so it can't tell concurrent requests apart under the gevent worker
+            response = model.generate_content(
+                prompt,
+                request_options={"timeout": GEMINI_TIMEOUT}
+            )
 
             if response and response.text:
                 return render_template("scheme_result.html", advice=response.text)
 
         except Exception as e:
-            signal.alarm(0)  # ensure alarm always cleared
             print("Gemini failed, switching to fallback:", e)
 
         # -------------------
@@ -637,7 +719,7 @@ def scheme_advisor():
             results = cur.fetchall()
 
             cur.close()
-            conn.close()
+            release_db_connection(conn)
 
         except Exception as e:
             return f"Database Error: {str(e)}"
@@ -0,0 +1,38 @@
+# Async serving mode: one gevent worker holds many in-flight requests while
+# they wait on Postgres or Gemini, instead of one request per sync worker.
+#
+#   gunicorn -c gunicorn_async.conf.py app:app
+#
+# Deliberately not named gunicorn.conf.py so the default deployment keeps the
+# sync workers unless this file is asked for.
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:" + os.getenv("PORT", "8000"))
+workers = int(os.getenv("GUNICORN_WORKERS", "1"))
+worker_class = "gevent"
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", "1000"))
+
+# With gevent this is a heartbeat check, not a request timeout: requests
+# waiting on a socket don't trip it, only code that blocks the whole event
+# loop (e.g. the grpc transport or unpatched psycopg2) for this long does
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+
+# app.py creates its pool semaphore at import; it must be imported in the
+# worker after gevent patches threading, or it blocks the whole worker
+preload_app = False
+
+raw_env = [
+    # grpc does not yield to gevent; the REST transport does
+    "GEMINI_TRANSPORT=" + os.getenv("GEMINI_TRANSPORT", "rest"),
+    # app.py defaults to one connection, which is all a sync worker uses
+    "DB_POOL_SIZE=" + os.getenv("DB_POOL_SIZE", "10"),
+]
+
+
+def post_fork(server, worker):
+    # psycopg2 is a C extension, so gevent's monkey patching alone does not
+    # stop a query from blocking the worker; psycogreen installs a wait
+    # callback that yields to the gevent hub while Postgres is busy
+    from psycogreen.gevent import patch_psycopg
+
+    patch_psycopg()
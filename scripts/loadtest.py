@@ -0,0 +1,237 @@
+"""Load test the I/O-bound routes and report throughput next to server memory.
+
+Typical run against a local Postgres and the stub LLM server:
+
+    python scripts/stub_gemini.py --delay 2 &
+    export DATABASE_URL=postgresql://postgres@127.0.0.1/policypulse
+    export DB_SSLMODE=disable SECRET_KEY=loadtest
+    export GEMINI_API_ENDPOINT=http://127.0.0.1:8081 GOOGLE_API_KEY=stub
+
+    # async mode: a single gevent worker
+    gunicorn -c gunicorn_async.conf.py -p /tmp/gunicorn.pid app:app &
+    curl -s http://127.0.0.1:8000/init-db
+    python scripts/loadtest.py --concurrency 200 --pid $(cat /tmp/gunicorn.pid) \
+        --database-url "$DATABASE_URL"
+    kill $(cat /tmp/gunicorn.pid)
+
+    # baseline: a single sync worker, same memory budget
+    GEMINI_TRANSPORT=rest gunicorn -w 1 -t 60 -b 0.0.0.0:8000 \
+        -p /tmp/gunicorn.pid app:app &
+    python scripts/loadtest.py --concurrency 200 --pid $(cat /tmp/gunicorn.pid)
+    kill $(cat /tmp/gunicorn.pid)
+
+With the stub's 2 s delay expect the sync worker to top out near 0.5 req/s on
+/scheme-advisor, while the gevent worker scales with --concurrency until the
+DB pool (DB_POOL_SIZE) or CPU becomes the limit. RSS is summed over the
+gunicorn master and its workers so both modes are compared at equal memory.
+
+A /scheme-advisor request only counts as ok if it carries the stub's advice,
+so the Gemini fallback (a misconfigured endpoint or transport) shows up as a
+failure rather than a fast success. With --database-url the app's Postgres
+connections are listed afterwards; if the pool is reusing them, the number
+opened during the run stays at or below DB_POOL_SIZE per worker.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+import uuid
+
+import httpx
+import psycopg2
+
+
+# Must match scripts/stub_gemini.py and app.DB_APPLICATION_NAME
+STUB_ADVICE_MARKER = "PM Kisan Samman Nidhi"
+DB_APPLICATION_NAME = "policypulse"
+
+SCHEME_FORM = {
+    "age": "34",
+    "gender": "Male",
+    "income": "12000",
+    "occupation": "Farmer",
+    "state": "Maharashtra",
+    "area_type": "Rural",
+    "need": "Agriculture"
+}
+
+
+def process_tree_rss_kb(pid):
+    """Resident memory of ``pid`` and all of its descendants, in kB."""
+    total = 0
+    pending = [pid]
+
+    while pending:
+        current = pending.pop()
+        try:
+            with open(f"/proc/{current}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1])
+                        break
+
+            for task in os.listdir(f"/proc/{current}/task"):
+                with open(f"/proc/{current}/task/{task}/children") as f:
+                    pending.extend(int(child) for child in f.read().split())
+        except (FileNotFoundError, ProcessLookupError):
+            continue
+
+    return total
+
+
+async def sample_memory(pid, samples, stop):
+    while not stop.is_set():
+        samples.append(process_tree_rss_kb(pid))
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=0.5)
+        except asyncio.TimeoutError:
+            pass
+
+
+def app_db_connections(database_url, since):
+    """(open, opened since ``since``) counts of the app's Postgres connections."""
+    conn = psycopg2.connect(database_url)
+    try:
+        cur = conn.cursor()
+        cur.execute(
+            """
+            SELECT COUNT(*), COUNT(*) FILTER (WHERE backend_start >= to_timestamp(%s))
+            FROM pg_stat_activity
+            WHERE application_name = %s
+            """,
+            (since, DB_APPLICATION_NAME)
+        )
+        return cur.fetchone()
+    finally:
+        conn.close()
+
+
+async def log_in(client):
+    email = f"loadtest-{uuid.uuid4().hex[:12]}@example.com"
+    password = "loadtest"
+
+    await client.post("/register", data={
+        "name": "Load Test",
+        "email": email,
+        "password": password
+    })
+    response = await client.post("/login", data={
+        "email": email,
+        "password": password
+    })
+
+    if response.status_code != 302:
+        raise SystemExit(f"Login failed ({response.status_code}): {response.text[:200]}")
+
+
+async def hit(client, route, latencies, errors):
+    started = time.perf_counter()
+    try:
+        if route == "/scheme-advisor":
+            response = await client.post(route, data=SCHEME_FORM)
+        else:
+            response = await client.get(route)
+
+        if response.status_code != 200:
+            errors.append(f"{route}: HTTP {response.status_code}")
+            return
+
+        # The route answers 200 from its DB fallback too, so only the stub's
+        # advice proves the LLM call went through
+        if route == "/scheme-advisor" and STUB_ADVICE_MARKER not in response.text:
+            errors.append(f"{route}: no LLM advice in response")
+            return
+    except httpx.HTTPError as e:
+        errors.append(f"{route}: {type(e).__name__}")
+        return
+
+    latencies.append(time.perf_counter() - started)
+
+
+async def run(args):
+    limits = httpx.Limits(max_connections=args.concurrency,
+                          max_keepalive_connections=args.concurrency)
+    timeout = httpx.Timeout(args.timeout)
+
+    async with httpx.AsyncClient(base_url=args.url, limits=limits,
+                                 timeout=timeout) as client:
+        await log_in(client)
+
+        routes = [args.routes[i % len(args.routes)] for i in range(args.requests)]
+        queue = asyncio.Queue()
+        for route in routes:
+            queue.put_nowait(route)
+
+        latencies = []
+        errors = []
+
+        async def worker():
+            while True:
+                try:
+                    route = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                await hit(client, route, latencies, errors)
+
+        memory = []
+        stop = asyncio.Event()
+        sampler = None
+        if args.pid:
+            sampler = asyncio.create_task(sample_memory(args.pid, memory, stop))
+
+        wall_started = time.time()
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - started
+
+        stop.set()
+        if sampler:
+            await sampler
+
+    print(f"routes        {', '.join(args.routes)}")
+    print(f"concurrency   {args.concurrency}")
+    print(f"requests      {len(latencies)} ok, {len(errors)} failed in {elapsed:.2f}s")
+    print(f"throughput    {len(latencies) / elapsed:.1f} req/s")
+
+    if latencies:
+        latencies.sort()
+        p95 = latencies[max(0, int(len(latencies) * 0.95) - 1)]
+        print(f"latency       p50 {statistics.median(latencies) * 1000:.0f} ms, "
+              f"p95 {p95 * 1000:.0f} ms, max {latencies[-1] * 1000:.0f} ms")
+
+    if memory:
+        print(f"server RSS    peak {max(memory) / 1024:.1f} MB, "
+              f"mean {statistics.mean(memory) / 1024:.1f} MB")
+
+    if args.database_url:
+        open_conns, opened = app_db_connections(args.database_url, wall_started)
+        print(f"db conns      {open_conns} open, {opened} opened during run")
+
+    for error, count in sorted(
+        ((e, errors.count(e)) for e in set(errors)), key=lambda x: -x[1]
+    )[:5]:
+        print(f"  {count} x {error}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--routes", nargs="+",
+                        default=["/scheme-advisor", "/dashboard"],
+                        choices=["/scheme-advisor", "/dashboard"])
+    parser.add_argument("--requests", type=int, default=1000,
+                        help="total requests to send (default: 1000)")
+    parser.add_argument("--concurrency", type=int, default=200,
+                        help="requests kept in flight (default: 200)")
+    parser.add_argument("--timeout", type=float, default=120.0,
+                        help="per-request timeout in seconds (default: 120)")
+    parser.add_argument("--pid", type=int,
+                        help="gunicorn master pid, to report server memory")
+    parser.add_argument("--database-url",
+                        help="app database, to report connection reuse")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Stand-in for the Gemini REST API, for load testing /scheme-advisor.
+
+Answers every ``...:generateContent`` POST after a fixed delay, so the app's
+LLM wait can be reproduced without an API key or quota:
+
+    python scripts/stub_gemini.py --port 8081 --delay 2
+    GEMINI_TRANSPORT=rest GEMINI_API_ENDPOINT=http://127.0.0.1:8081 ...
+"""
+import argparse
+import json
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+ADVICE = (
+    "1. Scheme Name: PM Kisan Samman Nidhi\n"
+    "2. Key Benefits: Income support of Rs 6000 per year.\n"
+    "3. Eligibility Criteria: Small and marginal farmers.\n"
+    "4. How to Apply: Through the PM-Kisan portal or a CSC centre."
+)
+
+
+class StubGeminiServer(ThreadingHTTPServer):
+    # Class attributes, because the listen() backlog is set in __init__
+    request_queue_size = 1024
+    daemon_threads = True
+
+
+class StubGeminiHandler(BaseHTTPRequestHandler):
+    delay = 0.0
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        self.rfile.read(length)
+
+        if not self.path.split("?")[0].endswith(":generateContent"):
+            self.send_error(404)
+            return
+
+        time.sleep(self.delay)
+
+        body = json.dumps({
+            "candidates": [{
+                "content": {"role": "model", "parts": [{"text": ADVICE}]},
+                "finishReason": "STOP",
+                "index": 0
+            }]
+        }).encode()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--delay", type=float, default=2.0,
+                        help="seconds to wait before answering (default: 2)")
+    args = parser.parse_args()
+
+    StubGeminiHandler.delay = args.delay
+    server = StubGeminiServer((args.host, args.port), StubGeminiHandler)
+
+    print(f"Stub Gemini on http://{args.host}:{args.port} (delay {args.delay}s)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()